@@ -1,12 +1,17 @@
 # home.py - D-HAM Multi-Strategy Workspace with Auto-Updates
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import json
 import time  # ADDED for auto-update functionality
 from pathlib import Path
+from string import Template
 from textwrap import dedent
-from datetime import datetime, timedelta
+from datetime import datetime, time as dtime, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 import os
-import pytz 
+import threading
 import yfinance as yf 
 import pandas as pd
 import numpy as np
@@ -25,17 +30,13 @@ st.set_page_config(
 # --------------------------------------------------------------------------------------
 # Theme / CSS (Final Polish)
 # --------------------------------------------------------------------------------------
-BLOOM_BG       = "#0B0F14"    
-BLOOM_PANEL    = "#121820"    
-BLOOM_TEXT     = "#FFFFF5"
-BLOOM_MUTED    = "rgba(255,255,255,0.45)"
-NEUTRAL_GRAY   = "#4A5B6E"    
-INPUT_BG       = "#2E3A46"    
-INPUT_BG_LIGHT = "#3A4654"    
+# Status badge colours; they match --blue/--green/--purple in the styles.css :root palette
 ACCENT_BLUE    = "#2BB3F3"    
 ACCENT_GREEN   = "#26D07C"    
 ACCENT_PURPLE  = "#8A7CF5"    
-DARK_PURPLE    = "#3A2A6A"    
+
+# Global stylesheet; its :root block is the page palette
+STYLES_PATH = Path(__file__).with_name("styles.css")
 
 # --- Market Data Configuration ---
 MAJOR_TICKERS = ["SPY", "QQQ", "IWM", "^VIX", "GLD", "SLV", "TLT"]
@@ -48,89 +49,110 @@ COUNTRY_TICKERS = {
     "EAFE": "EFA", "Emerging": "EEM", "Europe": "EZU", "Japan": "EWJ", "China": "MCHI",
     "Canada": "EWC", "Brazil": "EWZ"
 }
-HEATMAP_TICKERS = list(set(MAJOR_TICKERS + list(SECTOR_TICKERS.values()) + list(COUNTRY_TICKERS.values())))
-
-def get_spx_tickers():
-    return [
-        'MMM', 'AOS', 'ABT', 'ABBV', 'ACN', 'ADBE', 'AMD', 'AES', 'AFL', 'A',
-        'APD', 'ABNB', 'AKAM', 'ALB', 'ARE', 'ALGN', 'ALLE', 'LNT', 'ALL', 'GOOGL',
-        'GOOG', 'MO', 'AMZN', 'AMCR', 'AEE', 'AEP', 'AXP', 'AIG', 'AMT', 'AWK',
-        'AMP', 'AME', 'AMGN', 'APH', 'ADI', 'AON', 'APA', 'APO', 'AAPL', 'AMAT',
-        'APTV', 'ACGL', 'ADM', 'ANET', 'AJG', 'AIZ', 'T', 'ATO', 'ADSK', 'ADP',
-        'AZO', 'AVB', 'AVY', 'AXON', 'BKR', 'BALL', 'BAC', 'BAX', 'BDX',
-        'BBY', 'TECH', 'BIIB', 'BLK', 'BX', 'BK', 'BA', 'BKNG', 'BSX', 'BMY',
-        'AVGO', 'BR', 'BRO', 'BLDR', 'BG', 'BXP', 'CHRW', 'CDNS', 'CZR',
-        'CPT', 'CPB', 'COF', 'CAH', 'KMX', 'CCL', 'CARR', 'CAT', 'CBOE', 'CBRE',
-        'CDW', 'COR', 'CNC', 'CNP', 'CF', 'CRL', 'SCHW', 'CHTR', 'CVX', 'CMG',
-        'CB', 'CHD', 'CI', 'CINF', 'CTAS', 'CSCO', 'C', 'CFG', 'CLX', 'CME',
-        'CMS', 'KO', 'CTSH', 'COIN', 'CL', 'CMCSA', 'CAG', 'COP', 'ED', 'STZ',
-        'CEG', 'COO', 'CPRT', 'GLW', 'CPAY', 'CTVA', 'CSGP', 'COST', 'CTRA', 'CRWD',
-        'CCI', 'CSX', 'CMI', 'CVS', 'DHR', 'DRI', 'DDOG', 'DVA', 'DAY', 'DECK',
-        'DE', 'DELL', 'DAL', 'DVN', 'DXCM', 'FANG', 'DLR', 'DG', 'DLTR', 'D',
-        'DPZ', 'DASH', 'DOV', 'DOW', 'DHI', 'DTE', 'DUK', 'DD', 'EMN', 'ETN',
-        'EBAY', 'ECL', 'EIX', 'EW', 'EA', 'ELV', 'EMR', 'ENPH', 'ETR', 'EOG',
-        'EPAM', 'EQT', 'EFX', 'EQIX', 'EQR', 'ERIE', 'ESS', 'EL', 'EG', 'EVRG',
-        'ES', 'EXC', 'EXE', 'EXPE', 'EXPD', 'EXR', 'XOM', 'FFIV', 'FDS', 'FICO',
-        'FAST', 'FRT', 'FDX', 'FIS', 'FITB', 'FSLR', 'FE', 'FI', 'F', 'FTNT',
-        'FTV', 'FOXA', 'FOX', 'BEN', 'FCX', 'GRMN', 'IT', 'GE', 'GEHC', 'GEV',
-        'GEN', 'GNRC', 'GD', 'GIS', 'GM', 'GPC', 'GILD', 'GPN', 'GL', 'GDDY',
-        'GS', 'HAL', 'HIG', 'HAS', 'HCA', 'DOC', 'HSIC', 'HSY', 'HPE', 'HLT',
-        'HOLX', 'HD', 'HON', 'HRL', 'HST', 'HWM', 'HPQ', 'HUBB', 'HUM', 'HBAN',
-        'HII', 'IBM', 'IEX', 'IDXX', 'ITW', 'INCY', 'IR', 'PODD', 'INTC', 'IBKR',
-        'ICE', 'IFF', 'IP', 'IPG', 'INTU', 'ISRG', 'IVZ', 'INVH', 'IQV', 'IRM',
-        'JBHT', 'JBL', 'JKHY', 'J', 'JNJ', 'JCI', 'JPM', 'K', 'KVUE', 'KDP',
-        'KEY', 'KEYS', 'KMB', 'KIM', 'KMI', 'KKR', 'KLAC', 'KHC', 'KR', 'LHX',
-        'LH', 'LRCX', 'LW', 'LVS', 'LDOS', 'LEN', 'LII', 'LLY', 'LIN', 'LYV',
-        'LKQ', 'LMT', 'L', 'LOW', 'LULU', 'LYB', 'MTB', 'MPC', 'MKTX', 'MAR',
-        'MMC', 'MLM', 'MAS', 'MA', 'MTCH', 'MKC', 'MCD', 'MCK', 'MDT', 'MRK',
-        'META', 'MET', 'MTD', 'MGM', 'MCHP', 'MU', 'MSFT', 'MAA', 'MRNA', 'MHK',
-        'MOH', 'TAP', 'MDLZ', 'MPWR', 'MNST', 'MCO', 'MS', 'MOS', 'MSI', 'MSCI',
-        'NDAQ', 'NTAP', 'NFLX', 'NEM', 'NWSA', 'NWS', 'NEE', 'NKE', 'NI', 'NDSN',
-        'NSC', 'NTRS', 'NOC', 'NCLH', 'NRG', 'NUE', 'NVDA', 'NVR', 'NXPI', 'ORLY',
-        'OXY', 'ODFL', 'OMC', 'ON', 'OKE', 'ORCL', 'OTIS', 'PCAR', 'PKG', 'PLTR',
-        'PANW', 'PSKY', 'PH', 'PAYX', 'PAYC', 'PYPL', 'PNR', 'PEP', 'PFE', 'PCG',
-        'PM', 'PSX', 'PNW', 'PNC', 'POOL', 'PPG', 'PPL', 'PFG', 'PG', 'PGR',
-        'PLD', 'PRU', 'PEG', 'PTC', 'PSA', 'PHM', 'PWR', 'QCOM', 'DGX', 'RL',
-        'RJF', 'RTX', 'O', 'REG', 'REGN', 'RF', 'RSG', 'RMD', 'RVTY', 'ROK',
-        'ROL', 'ROP', 'ROST', 'RCL', 'SPGI', 'CRM', 'SBAC', 'SLB', 'STX', 'SRE',
-        'NOW', 'SHW', 'SPG', 'SWKS', 'SJM', 'SW', 'SNA', 'SOLV', 'SO', 'LUV',
-        'SWK', 'SBUX', 'STT', 'STLD', 'STE', 'SYK', 'SMCI', 'SYF', 'SNPS', 'SYY',
-        'TMUS', 'TROW', 'TTWO', 'TPR', 'TRGP', 'TGT', 'TEL', 'TDY', 'TER', 'TSLA',
-        'TXN', 'TPL', 'TXT', 'TMO', 'TJX', 'TKO', 'TTD', 'TSCO', 'TT', 'TDG',
-        'TRV', 'TRMB', 'TFC', 'TYL', 'TSN', 'USB', 'UBER', 'UDR', 'ULTA', 'UNP',
-        'UAL', 'UPS', 'URI', 'UNH', 'UHS', 'VLO', 'VTR', 'VLTO', 'VRSN', 'VRSK',
-        'VZ', 'VRTX', 'VTRS', 'VICI', 'V', 'VST', 'VMC', 'WRB', 'GWW', 'WAB',
-        'WMT', 'DIS', 'WBD', 'WM', 'WAT', 'WEC', 'WFC', 'WELL', 'WST', 'WDC',
-        'WY', 'WSM', 'WMB', 'WTW', 'WDAY', 'WYNN', 'XEL', 'XYL', 'YUM', 'ZBRA',
-        'ZBH', 'ZTS', 'HIMS'
-    ]
-
-SPX_MOVER_TICKERS = get_spx_tickers()
+HEATMAP_TICKERS: tuple[str, ...] = tuple(sorted({*MAJOR_TICKERS, *SECTOR_TICKERS.values(), *COUNTRY_TICKERS.values()}))
+# Heatmap box order (Major, Sector, Country) and the category of each box
+HEATMAP_LAYOUT = (*MAJOR_TICKERS, *SECTOR_TICKERS.values(), *COUNTRY_TICKERS.values())
+HEATMAP_CATEGORIES = (
+    ["Major Indices"] * len(MAJOR_TICKERS)
+    + ["Sector ETFs"] * len(SECTOR_TICKERS)
+    + ["Country ETFs"] * len(COUNTRY_TICKERS)
+)
+# Rows back from the latest bar used as the reference price for each return period
+RETURN_OFFSETS = {'1D': 2, '7D': 6, '30D': 22, '1Y': 260}
+HEATMAP_PERIODS = ['1D', '7D', '30D', 'YTD', '1Y']
+NY_TZ = ZoneInfo("America/New_York")
+MARKET_OPEN = dtime(9, 30)   # regular session, New York time
+MARKET_CLOSE = dtime(16, 0)
+MARKET_SETTLE = dtime(16, 30)  # ^VIX settles at 16:15 and closing-auction prints land after the bell
+PRICE_CACHE_DIR = Path("cache")
+PRICE_CACHE_TTL = 300  # seconds, shared by the in-memory and on-disk price caches
+CLOSED_PRICE_CACHE_TTL = 24 * 3600  # outside market hours daily bars only change at the close
+# yf.download writes into module-global state (yfinance.shared), so concurrent calls from
+# the warm-up thread, the movers scan and other sessions are serialized
+_YF_DOWNLOAD_LOCK = threading.Lock()
+# Last movers scan, shared across sessions and restarts
+MOVERS_CACHE_FILES = {
+    "gainers": PRICE_CACHE_DIR / "movers_gainers.parquet",
+    "losers": PRICE_CACHE_DIR / "movers_losers.parquet",
+    "meta": PRICE_CACHE_DIR / "movers.json",
+}
+
+SPX_MOVER_TICKERS: tuple[str, ...] = (
+    'MMM', 'AOS', 'ABT', 'ABBV', 'ACN', 'ADBE', 'AMD', 'AES', 'AFL', 'A',
+    'APD', 'ABNB', 'AKAM', 'ALB', 'ARE', 'ALGN', 'ALLE', 'LNT', 'ALL', 'GOOGL',
+    'GOOG', 'MO', 'AMZN', 'AMCR', 'AEE', 'AEP', 'AXP', 'AIG', 'AMT', 'AWK',
+    'AMP', 'AME', 'AMGN', 'APH', 'ADI', 'AON', 'APA', 'APO', 'AAPL', 'AMAT',
+    'APTV', 'ACGL', 'ADM', 'ANET', 'AJG', 'AIZ', 'T', 'ATO', 'ADSK', 'ADP',
+    'AZO', 'AVB', 'AVY', 'AXON', 'BKR', 'BALL', 'BAC', 'BAX', 'BDX',
+    'BBY', 'TECH', 'BIIB', 'BLK', 'BX', 'BK', 'BA', 'BKNG', 'BSX', 'BMY',
+    'AVGO', 'BR', 'BRO', 'BLDR', 'BG', 'BXP', 'CHRW', 'CDNS', 'CZR',
+    'CPT', 'CPB', 'COF', 'CAH', 'KMX', 'CCL', 'CARR', 'CAT', 'CBOE', 'CBRE',
+    'CDW', 'COR', 'CNC', 'CNP', 'CF', 'CRL', 'SCHW', 'CHTR', 'CVX', 'CMG',
+    'CB', 'CHD', 'CI', 'CINF', 'CTAS', 'CSCO', 'C', 'CFG', 'CLX', 'CME',
+    'CMS', 'KO', 'CTSH', 'COIN', 'CL', 'CMCSA', 'CAG', 'COP', 'ED', 'STZ',
+    'CEG', 'COO', 'CPRT', 'GLW', 'CPAY', 'CTVA', 'CSGP', 'COST', 'CTRA', 'CRWD',
+    'CCI', 'CSX', 'CMI', 'CVS', 'DHR', 'DRI', 'DDOG', 'DVA', 'DAY', 'DECK',
+    'DE', 'DELL', 'DAL', 'DVN', 'DXCM', 'FANG', 'DLR', 'DG', 'DLTR', 'D',
+    'DPZ', 'DASH', 'DOV', 'DOW', 'DHI', 'DTE', 'DUK', 'DD', 'EMN', 'ETN',
+    'EBAY', 'ECL', 'EIX', 'EW', 'EA', 'ELV', 'EMR', 'ENPH', 'ETR', 'EOG',
+    'EPAM', 'EQT', 'EFX', 'EQIX', 'EQR', 'ERIE', 'ESS', 'EL', 'EG', 'EVRG',
+    'ES', 'EXC', 'EXE', 'EXPE', 'EXPD', 'EXR', 'XOM', 'FFIV', 'FDS', 'FICO',
+    'FAST', 'FRT', 'FDX', 'FIS', 'FITB', 'FSLR', 'FE', 'FI', 'F', 'FTNT',
+    'FTV', 'FOXA', 'FOX', 'BEN', 'FCX', 'GRMN', 'IT', 'GE', 'GEHC', 'GEV',
+    'GEN', 'GNRC', 'GD', 'GIS', 'GM', 'GPC', 'GILD', 'GPN', 'GL', 'GDDY',
+    'GS', 'HAL', 'HIG', 'HAS', 'HCA', 'DOC', 'HSIC', 'HSY', 'HPE', 'HLT',
+    'HOLX', 'HD', 'HON', 'HRL', 'HST', 'HWM', 'HPQ', 'HUBB', 'HUM', 'HBAN',
+    'HII', 'IBM', 'IEX', 'IDXX', 'ITW', 'INCY', 'IR', 'PODD', 'INTC', 'IBKR',
+    'ICE', 'IFF', 'IP', 'IPG', 'INTU', 'ISRG', 'IVZ', 'INVH', 'IQV', 'IRM',
+    'JBHT', 'JBL', 'JKHY', 'J', 'JNJ', 'JCI', 'JPM', 'K', 'KVUE', 'KDP',
+    'KEY', 'KEYS', 'KMB', 'KIM', 'KMI', 'KKR', 'KLAC', 'KHC', 'KR', 'LHX',
+    'LH', 'LRCX', 'LW', 'LVS', 'LDOS', 'LEN', 'LII', 'LLY', 'LIN', 'LYV',
+    'LKQ', 'LMT', 'L', 'LOW', 'LULU', 'LYB', 'MTB', 'MPC', 'MKTX', 'MAR',
+    'MMC', 'MLM', 'MAS', 'MA', 'MTCH', 'MKC', 'MCD', 'MCK', 'MDT', 'MRK',
+    'META', 'MET', 'MTD', 'MGM', 'MCHP', 'MU', 'MSFT', 'MAA', 'MRNA', 'MHK',
+    'MOH', 'TAP', 'MDLZ', 'MPWR', 'MNST', 'MCO', 'MS', 'MOS', 'MSI', 'MSCI',
+    'NDAQ', 'NTAP', 'NFLX', 'NEM', 'NWSA', 'NWS', 'NEE', 'NKE', 'NI', 'NDSN',
+    'NSC', 'NTRS', 'NOC', 'NCLH', 'NRG', 'NUE', 'NVDA', 'NVR', 'NXPI', 'ORLY',
+    'OXY', 'ODFL', 'OMC', 'ON', 'OKE', 'ORCL', 'OTIS', 'PCAR', 'PKG', 'PLTR',
+    'PANW', 'PSKY', 'PH', 'PAYX', 'PAYC', 'PYPL', 'PNR', 'PEP', 'PFE', 'PCG',
+    'PM', 'PSX', 'PNW', 'PNC', 'POOL', 'PPG', 'PPL', 'PFG', 'PG', 'PGR',
+    'PLD', 'PRU', 'PEG', 'PTC', 'PSA', 'PHM', 'PWR', 'QCOM', 'DGX', 'RL',
+    'RJF', 'RTX', 'O', 'REG', 'REGN', 'RF', 'RSG', 'RMD', 'RVTY', 'ROK',
+    'ROL', 'ROP', 'ROST', 'RCL', 'SPGI', 'CRM', 'SBAC', 'SLB', 'STX', 'SRE',
+    'NOW', 'SHW', 'SPG', 'SWKS', 'SJM', 'SW', 'SNA', 'SOLV', 'SO', 'LUV',
+    'SWK', 'SBUX', 'STT', 'STLD', 'STE', 'SYK', 'SMCI', 'SYF', 'SNPS', 'SYY',
+    'TMUS', 'TROW', 'TTWO', 'TPR', 'TRGP', 'TGT', 'TEL', 'TDY', 'TER', 'TSLA',
+    'TXN', 'TPL', 'TXT', 'TMO', 'TJX', 'TKO', 'TTD', 'TSCO', 'TT', 'TDG',
+    'TRV', 'TRMB', 'TFC', 'TYL', 'TSN', 'USB', 'UBER', 'UDR', 'ULTA', 'UNP',
+    'UAL', 'UPS', 'URI', 'UNH', 'UHS', 'VLO', 'VTR', 'VLTO', 'VRSN', 'VRSK',
+    'VZ', 'VRTX', 'VTRS', 'VICI', 'V', 'VST', 'VMC', 'WRB', 'GWW', 'WAB',
+    'WMT', 'DIS', 'WBD', 'WM', 'WAT', 'WEC', 'WFC', 'WELL', 'WST', 'WDC',
+    'WY', 'WSM', 'WMB', 'WTW', 'WDAY', 'WYNN', 'XEL', 'XYL', 'YUM', 'ZBRA',
+    'ZBH', 'ZTS', 'HIMS'
+)
 
 # --------------------------------------------------------------------------------------
 # --- GLOBAL HELPER FUNCTIONS ---
 # --------------------------------------------------------------------------------------
 
+@st.cache_data(ttl=30, show_spinner=False)  # status flips at most 30s late around the bell
 def get_market_status():
     """Checks the status of the US equity market (NYSE/NASDAQ)."""
-    tz = pytz.timezone('America/New_York')
-    now = datetime.now(tz)
+    now = datetime.now(NY_TZ)
+    clock = now.time()
     
     is_weekday = 0 <= now.weekday() <= 4
-    market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
-    market_close = now.replace(hour=16, minute=0, second=0, microsecond=0)
-
-    is_open = is_weekday and (market_open <= now < market_close)
+    is_open = is_weekday and (MARKET_OPEN <= clock < MARKET_CLOSE)
     
     cache_ttl = timedelta(hours=4) 
 
     if not is_weekday:
         status_text = "Market Closed (Weekend)"
         status_color = ACCENT_PURPLE
-    elif now >= market_close:
+    elif clock >= MARKET_CLOSE:
         status_text = "Market Closed (After Hours)"
         status_color = "#D9534F"
-    elif now < market_open:
+    elif clock < MARKET_OPEN:
         status_text = "Market Closed (Pre-Market)"
         status_color = ACCENT_BLUE
     else:
@@ -139,9 +161,8 @@ def get_market_status():
 
     return now, is_open, status_text, status_color, cache_ttl
 
-@st.cache_data(show_spinner=False)
-def get_metric_styles(change_pct):
-    """Determines color and icon based on percentage change."""
+@lru_cache(maxsize=256)
+def _metric_styles(change_pct):
     if change_pct > 0.01:
         color_token = "--green-accent"
         icon = '↑'
@@ -153,131 +174,281 @@ def get_metric_styles(change_pct):
         icon = '•'
     return f"var({color_token})", icon, f"var({color_token})"
 
-@st.cache_data(ttl=300, show_spinner=False)  # 5 minute cache instead of 1 hour
-def fetch_ticker_data(tickers):
-    """Fetches the last 15 months of adjusted close prices for tickers."""
-    tickers = list(set(tickers)) 
-    if not tickers:
-        return pd.DataFrame()
+def get_metric_styles(change_pct):
+    """Determines color and icon based on percentage change."""
+    return _metric_styles(float(change_pct))
+
+def _price_cache_path(tickers, period, session=None):
+    """Disk cache file for a ticker set and history window, bucketed by New York trading day."""
+    day = datetime.now(NY_TZ).date().isoformat()
+    key = hashlib.md5((",".join(sorted(tickers)) + period + day + str(session)).encode()).hexdigest()
+    return PRICE_CACHE_DIR / f"prices_{key}.parquet"
+
+def _price_cache_files():
+    """Price panels on disk (the saved movers scan lives in the same folder and is left alone)."""
+    return PRICE_CACHE_DIR.glob("prices_*.parquet")
+
+def _prune_price_cache():
+    """Deletes price panels older than any reader will accept; the day in the key means old ones are never reused."""
+    cutoff = time.time() - CLOSED_PRICE_CACHE_TTL
+    for path in _price_cache_files():
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+def _has_gaps(panel):
+    """True when a download came back empty or with a ticker missing entirely (e.g. a Yahoo throttle)."""
+    return panel.empty or bool(panel.isna().all().any())
+
+class _IncompletePanel(Exception):
+    """Raised from the closed-market cache so a partial download is not held until the next close."""
+
+def _load_prices(tickers, period, max_age, session=None):
+    """Downloads adjusted closes, reusing a disk copy younger than `max_age` seconds."""
+    # A worker restart reuses today's download from disk while it is still fresh
+    cache_path = _price_cache_path(tickers, period, session)
+    try:
+        age = time.time() - cache_path.stat().st_mtime
+        if age < max_age:
+            cached = pd.read_parquet(cache_path)
+            # A panel with missing tickers is only trusted for the short TTL, then retried
+            if age < PRICE_CACHE_TTL or not _has_gaps(cached):
+                return cached
+    except Exception:
+        pass
+
     # Fetch data with auto_adjust=True to get the most current prices
-    data = yf.download(tickers, period="15mo", interval="1d", progress=False, auto_adjust=True, threads=True)
+    with _YF_DOWNLOAD_LOCK:
+        data = yf.download(list(tickers), period=period, interval="1d", progress=False, auto_adjust=True, threads=True)
     if data.empty:
         return pd.DataFrame()
-    return data['Close']
+    # float32 is plenty for 2-decimal returns and halves the cached frame
+    close_data = data['Close'].astype(np.float32, copy=False)
+
+    try:
+        PRICE_CACHE_DIR.mkdir(exist_ok=True)
+        close_data.to_parquet(cache_path)
+        _prune_price_cache()
+    except Exception:
+        pass
+    return close_data
+
+# cache_resource hands back the shared frame without a pickle round-trip; callers only read it
+@st.cache_resource(ttl=PRICE_CACHE_TTL, max_entries=8, show_spinner=False)  # 5 minute cache instead of 1 hour
+def _fetch_prices_live(tickers, period, session=None):
+    """Price panel while the market is open; with a `session`, the 5 minute read behind the closed-market cache."""
+    # Closed-market disk copies stay good for a day; _load_prices retries incomplete ones after PRICE_CACHE_TTL
+    max_age = PRICE_CACHE_TTL if session is None else CLOSED_PRICE_CACHE_TTL
+    return _load_prices(tickers, period, max_age, session)
+
+@st.cache_resource(ttl=CLOSED_PRICE_CACHE_TTL, max_entries=8, show_spinner=False)
+def _fetch_prices_closed(tickers, period, session):
+    """Price panel outside the session; `session` changes when a new daily bar can appear."""
+    data = _fetch_prices_live(tickers, period, session)
+    # Exceptions are not cached, so an empty or partial panel is only held by the 5 minute entry above
+    if _has_gaps(data):
+        raise _IncompletePanel()
+    return data
+
+def fetch_ticker_data(tickers, period="15mo"):
+    """Fetches adjusted close prices for tickers over `period` (15 months by default)."""
+    # Sorted so the cache entry (and its disk file) is order-independent
+    tickers = tuple(sorted(set(tickers)))
+    if not tickers:
+        return pd.DataFrame()
+
+    now, is_open = get_market_status()[:2]
+    # Today's bar keeps moving until it settles, so it stays on the short TTL until then
+    if is_open or MARKET_CLOSE <= now.time() < MARKET_SETTLE:
+        return _fetch_prices_live(tickers, period)
+    # Daily bars are final until the next close, so the entry is keyed on the
+    # date and which side of today's settle we are on instead of a short TTL
+    session = (now.date().isoformat(), now.time() >= MARKET_SETTLE)
+    try:
+        return _fetch_prices_closed(tickers, period, session)
+    except _IncompletePanel:
+        return _fetch_prices_live(tickers, period, session)
+
+def clear_price_cache():
+    """Drops the price panels in memory and on disk (open and closed market) so the next read downloads."""
+    _fetch_prices_live.clear()
+    _fetch_prices_closed.clear()
+    for path in _price_cache_files():
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+def _fast_quote(ticker):
+    """Reads last price and day change for one ticker from fast_info."""
+    try:
+        info = yf.Ticker(ticker).fast_info
+        last_price = info['lastPrice']
+        prev_close = info['previousClose']
+        return {
+            'lastPrice': last_price,
+            'regularMarketChangePercent': (last_price / prev_close - 1) * 100,
+        }
+    except Exception:
+        return None
 
 @st.cache_data(ttl=timedelta(seconds=5), show_spinner=False)
 def fetch_live_summary(tickers):
     """Fetches key metrics for market summary (5s TTL)."""
-    try:
-        data = yf.Tickers(tickers).fast_info
-        if isinstance(data, pd.DataFrame):
-            summary = data.T.to_dict() 
-        else:
-            summary = {t: data.get(t, {}) for t in tickers}
-        return summary
-    except Exception:
+    tickers = list(tickers)
+    if not tickers:
         return {}
+    # fast_info is one HTTP round-trip per ticker, so fan the lookups out
+    with ThreadPoolExecutor(max_workers=min(16, len(tickers))) as executor:
+        quotes = dict(zip(tickers, executor.map(_fast_quote, tickers)))
+    # Tickers that failed are left out so callers fall back to daily bars
+    return {t: q for t, q in quotes.items() if q is not None}
 
 def calculate_returns(data, period):
     """Calculates returns for the given period."""
     if data.empty: return pd.Series(dtype='float64')
-    
-    last_price = data.iloc[-1]
-    
-    if period == '1D':
-        ref_price = data.iloc[-2] if len(data) >= 2 else data.iloc[-1]
-    elif period == '7D':
-        idx = max(0, len(data) - 6) 
-        ref_price = data.iloc[idx]
-    elif period == '30D':
-        idx = max(0, len(data) - 22) 
-        ref_price = data.iloc[idx]
-    elif period == '1Y':
-        idx = max(0, len(data) - 260) 
-        ref_price = data.iloc[idx]
-    elif period == 'YTD':
-        current_year = data.index[-1].year
-        ytd_start_index = data.index[data.index.year == current_year].min()
-        if pd.notna(ytd_start_index) and ytd_start_index in data.index:
-             ref_price = data.loc[ytd_start_index]
-        else:
-            return pd.Series(0.0, index=data.columns) 
 
-    returns = ((last_price - ref_price) / ref_price) * 100
+    arr = data.to_numpy(copy=False)
+    ref_price = arr[_reference_row(data, period)]
+
+    returns = pd.Series(_pct_change(arr[-1], ref_price), index=data.columns)
     return returns.fillna(0.0)
 
-@st.cache_data(show_spinner=False)
+def _pct_change(last, ref):
+    """Percent change from ref to last; a zero reference price counts as no change."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(ref != 0, (last - ref) / ref * 100, 0.0)
+
+def _reference_row(data, period):
+    """Positional index of the reference bar for a return period."""
+    if period == 'YTD':
+        # First bar on/after Jan 1 of the latest year; binary search on the sorted
+        # index without building a per-row year array
+        year_start = data.index[-1].normalize().replace(month=1, day=1)
+        return data.index.searchsorted(year_start)
+    return max(0, len(data) - RETURN_OFFSETS[period])
+
+def calculate_all_returns(data):
+    """Calculates returns for every heatmap period in one pass (periods x tickers)."""
+    if data.empty: return pd.DataFrame(dtype='float64')
+
+    arr = data.to_numpy(copy=False)
+    ref_rows = arr[[_reference_row(data, period) for period in HEATMAP_PERIODS]]
+    pct = _pct_change(arr[-1], ref_rows)
+    return pd.DataFrame(pct, index=HEATMAP_PERIODS, columns=data.columns).fillna(0.0)
+
+@st.cache_data(ttl=PRICE_CACHE_TTL, show_spinner=False)
+def get_heatmap_returns(tickers_list):
+    """Returns for all heatmap periods from a single price fetch."""
+    # A year of bars covers every heatmap period, including 1Y (first bar) and YTD
+    return calculate_all_returns(fetch_ticker_data(tickers_list, period="1y"))
+
+@st.cache_resource(show_spinner=False)
+def _warm_price_cache():
+    """Starts the shared heatmap/KPI price download on a background thread, once per process."""
+    thread = threading.Thread(target=fetch_ticker_data, args=(HEATMAP_TICKERS, "1y"), daemon=True)
+    thread.start()
+    return thread
+
+@st.cache_data(ttl=PRICE_CACHE_TTL, max_entries=8, show_spinner=False)
 def generate_heatmap_data(period, tickers_list):
     """Generates data for the market heatmap."""
-    all_close_data = fetch_ticker_data(tickers_list) 
-    if all_close_data.empty: return pd.DataFrame(), False
-    
-    returns = calculate_returns(all_close_data, period)
-    
-    data = []
-    
-    major_row = {"Category": "Major Indices"}
-    for ticker in MAJOR_TICKERS:
-        if ticker in returns: major_row[ticker] = returns[ticker]
-    data.append(major_row)
-    
-    sector_row = {"Category": "Sector ETFs"}
-    for ticker in list(SECTOR_TICKERS.values()):
-        if ticker in returns: sector_row[ticker] = returns[ticker]
-    data.append(sector_row)
-
-    country_row = {"Category": "Country ETFs"}
-    for ticker in list(COUNTRY_TICKERS.values()):
-        if ticker in returns: country_row[ticker] = returns[ticker]
-    data.append(country_row)
-    
-    df = pd.DataFrame(data).set_index("Category").fillna(np.nan)
+    all_returns = get_heatmap_returns(tickers_list)
+    if all_returns.empty: return pd.DataFrame(), False
+
+    returns = all_returns.loc[period]
+
+    # Tidy (category, ticker, ret) rows in display order; tickers without data are dropped
+    df = pd.DataFrame({
+        "category": HEATMAP_CATEGORIES,
+        "ticker": HEATMAP_LAYOUT,
+        "ret": returns.reindex(HEATMAP_LAYOUT).to_numpy(),
+    }).dropna(subset=["ret"])
     return df, True
 
+# KPI card markup, dedented once at import instead of on every render
+_KPI_T = Template(dedent("""
+    <div class="kpi" style="
+         background: var(--inputlight);
+         border: 1px solid var(--neutral);
+         border-left: 5px solid $color;
+         padding: 10px 14px;
+         border-radius: 10px;
+         box-shadow: 0 2px 5px rgba(0,0,0,0.3);
+         transition: all 0.2s;">
+        <div class="h">$title</div>
+        <div class="v" style="color: $color;">$price</div>
+        <div class="text-sm font-semibold" style="color: $color;">$change_text</div>
+    </div>
+""").strip())
+
+_TIME_CARD_T = Template(dedent("""
+    <div class="kpi" style="
+         background: var(--inputlight);
+         border: 1px solid var(--neutral);
+         border-left: 5px solid $color;
+         padding: 10px 14px;
+         border-radius: 10px;
+         box-shadow: 0 2px 5px rgba(0,0,0,0.3);">
+        <div class="h">Current Time</div>
+        <div class="v" style="color: $color;">$time</div>
+        <div class="text-sm font-semibold" style="color: var(--muted-text-new);">Market Status</div>
+    </div>
+""").strip())
+
 def get_metric_html(title, price, change_pct, accent_color_token):
     """Generates the HTML for a Market KPI Card."""
     color, icon, _ = get_metric_styles(change_pct)
     change_text = f"{icon} {abs(change_pct):.2f}%"
-    
-    return dedent(f"""
-        <div class="kpi" style="
-             background: var(--inputlight); 
-             border: 1px solid var(--neutral); 
-             border-left: 5px solid {color};
-             padding: 10px 14px;
-             border-radius: 10px;
-             box-shadow: 0 2px 5px rgba(0,0,0,0.3);
-             transition: all 0.2s;">
-            <div class="h">{title}</div>
-            <div class="v" style="color: {color};">{price:.2f}</div>
-            <div class="text-sm font-semibold" style="color: {color};">{change_text}</div>
-        </div>
-    """)
 
-def get_heatmap_color_style(return_val):
-    """Calculates the CSS style string for a heatmap box."""
-    if pd.isna(return_val):
-        return "background-color: var(--inputlight); color: var(--muted-text-new); border: 1px dashed var(--neutral);"
-    
-    try:
-        val = float(return_val)
-    except ValueError:
-        return "background-color: var(--inputlight); color: var(--muted-text-new); border: 1px dashed var(--neutral);"
+    return _KPI_T.substitute(color=color, title=title, price=f"{price:.2f}", change_text=change_text)
+
+# Single-line box/row markup so the render loops only fill in values
+HEATMAP_BOX_TMPL = (
+    '<div class="heatmap-box" style="{style}">'
+    '<span class="heatmap-box-ticker">{ticker}</span>'
+    '<span class="heatmap-box-return">{ret_str}</span>'
+    '</div>'
+)
+MOVERS_ITEM_TMPL = (
+    '<div class="movers-item">'
+    '<span class="movers-ticker" style="color: var({color});">{ticker}</span>'
+    '<span class="movers-price">${price}</span>'
+    '<span class="movers-return" style="color: var({color});">{ret}</span>'
+    '</div>'
+)
 
+HEATMAP_EMPTY_STYLE = "background-color: var(--inputlight); color: var(--muted-text-new); border: 1px dashed var(--neutral);"
+
+def compute_heatmap_styles(vals):
+    """Calculates the CSS style strings for a whole array of heatmap returns."""
+    vals = np.asarray(vals, dtype='float64')
     max_saturation = 4.0
-    
-    if val > 0:
-        alpha = min(0.9, 0.1 + (val / max_saturation) * 0.8) 
-        bg = f'rgba(38, 208, 124, {alpha})' 
-    elif val < 0:
-        alpha = min(0.9, 0.1 + (abs(val) / max_saturation) * 0.8)
-        bg = f'rgba(217, 83, 79, {alpha})' 
-    else:
-        bg = f'rgba(138, 124, 245, 0.1)' 
-        
-    return f'background-color: {bg}; color: var(--text); border: 1px solid rgba(255,255,255,0.1);'
 
-@st.cache_data(show_spinner=False)
+    alpha = np.minimum(0.9, 0.1 + (np.abs(vals) / max_saturation) * 0.8)
+    rgb = np.where(vals > 0, '38, 208, 124', '217, 83, 79')
+
+    styles = []
+    for val, a, color in zip(vals.tolist(), alpha.tolist(), rgb.tolist()):
+        if val != val:  # NaN
+            styles.append(HEATMAP_EMPTY_STYLE)
+            continue
+        bg = f'rgba({color}, {a})' if val != 0 else 'rgba(138, 124, 245, 0.1)'
+        styles.append(f'background-color: {bg}; color: var(--text); border: 1px solid rgba(255,255,255,0.1);')
+    return styles
+
+def _download_close(tickers, period):
+    """Downloads adjusted closes for the whole ticker list in one yf.download call."""
+    with _YF_DOWNLOAD_LOCK:
+        data = yf.download(list(tickers), period=period, interval="1d", progress=False, auto_adjust=True, threads=True)
+    if data.empty:
+        return pd.DataFrame()
+    # Same float32 panel as fetch_ticker_data; halves the ~500 x 252 block the returns run over
+    return data['Close'].astype(np.float32, copy=False)
+
+@st.cache_data(max_entries=4, show_spinner=False)  # keyed on scan time, so bound it
 def get_top_movers_uncached(ticker_list, period, scan_time):
     """Fetches data, calculates returns, and returns top 5 gainers/losers - OPTIMIZED VERSION."""
     
@@ -294,130 +465,156 @@ def get_top_movers_uncached(ticker_list, period, scan_time):
         fetch_period = '1y'
     
     # Download data with optimized period
-    all_close_data = yf.download(ticker_list, period=fetch_period, interval="1d", progress=False, auto_adjust=True, threads=True)
+    all_close_data = _download_close(ticker_list, fetch_period)
     
     if all_close_data.empty: 
         return pd.DataFrame(), pd.DataFrame()
     
-    # Extract just the Close prices
-    if 'Close' in all_close_data.columns:
-        all_close_data = all_close_data['Close']
-    
-    returns = calculate_returns(all_close_data, period).rename("Return (%)")
-    last_prices = all_close_data.iloc[-1].rename("Price ($)")
-    
-    combined_df = pd.concat([returns, last_prices], axis=1).dropna(subset=['Price ($)'])
-    
-    top_gainers = combined_df.nlargest(5, "Return (%)")
-    top_losers = combined_df.nsmallest(5, "Return (%)")
-    
-    return top_gainers, top_losers
+    returns = calculate_returns(all_close_data, period)
+    prices = all_close_data.iloc[-1]
+
+    # Partial sort over tickers with a valid last price; no full sort of ~500 returns
+    valid = returns[prices.notna()].dropna()
+    if valid.empty:
+        return pd.DataFrame(), pd.DataFrame()
+
+    def movers_frame(picks):
+        return pd.DataFrame({"Return (%)": picks, "Price ($)": prices.loc[picks.index]})
+
+    return movers_frame(valid.nlargest(5)), movers_frame(valid.nsmallest(5))
 
 # --------------------------------------------------------------------------------------
 # NEW: Container Rendering Functions for Auto-Update
 # --------------------------------------------------------------------------------------
 
+def daily_change(panel, tickers):
+    """Maps each ticker in the close panel to (last close, % change from the prior close)."""
+    metrics = {}
+    for ticker in tickers:
+        if ticker not in panel:
+            continue
+        # The shared panel is date-aligned across tickers, so skip any gaps
+        closes = panel[ticker].dropna().to_numpy()
+        if len(closes) >= 2:
+            metrics[ticker] = (closes[-1], (closes[-1] / closes[-2] - 1) * 100)
+    return metrics
+
 def render_market_kpis_in_container(container, is_open, status_text, status_color):
     """Renders market KPIs in the provided container - enables targeted updates."""
     with container:
-        col_spy, col_qqq, col_vix, col_time = st.columns(4)
-        
         tickers_to_fetch = ["SPY", "QQQ", "^VIX"]
-        market_data = fetch_live_summary(tickers_to_fetch)
-        
-        def get_ticker_metric(ticker):
-            if ticker in market_data:
-                data = market_data[ticker]
-                price = data.get('lastPrice', 0.0)
-                change_pct = data.get('regularMarketChangePercent', 0.0)
-            else:
-                price = 0.0
-                change_pct = 0.0
-                try:
-                    close_data = fetch_ticker_data([ticker])
-                    if not close_data.empty and len(close_data) >= 2:
-                        close_data = close_data[ticker]
-                        price = close_data.iloc[-1]
-                        change_pct = ((close_data.iloc[-1] - close_data.iloc[-2]) / close_data.iloc[-2]) * 100
-                except Exception:
-                    pass
-            return price, change_pct
-
-        # SPY
-        spy_price, spy_change_pct = get_ticker_metric("SPY")
-        with col_spy:
-            st.markdown(get_metric_html("S&P 500 (SPY)", spy_price, spy_change_pct, "--green-accent"), 
-                       unsafe_allow_html=True)
-
-        # QQQ
-        qqq_price, qqq_change_pct = get_ticker_metric("QQQ")
-        with col_qqq:
-            st.markdown(get_metric_html("NASDAQ 100 (QQQ)", qqq_price, qqq_change_pct, "--red-neg"), 
-                       unsafe_allow_html=True)
-
-        # VIX
-        vix_price, vix_change_pct = get_ticker_metric("^VIX")
-        with col_vix:
-            st.markdown(get_metric_html("VIX Index (^VIX)", vix_price, vix_change_pct, "--purple"), 
-                       unsafe_allow_html=True)
-
-        # Time
-        now = datetime.now(pytz.timezone('America/New_York'))
-        current_time_str = now.strftime('%H:%M:%S EST')
-        
-        with col_time:
-            st.markdown(f"""
-                <div class="kpi" style="
-                     background: var(--inputlight); 
-                     border: 1px solid var(--neutral); 
-                     border-left: 5px solid {status_color};
-                     padding: 10px 14px;
-                     border-radius: 10px;
-                     box-shadow: 0 2px 5px rgba(0,0,0,0.3);">
-                    <div class="h">Current Time</div>
-                    <div class="v" style="color: {status_color};">{current_time_str}</div>
-                    <div class="text-sm font-semibold" style="color: var(--muted-text-new);">Market Status</div>
-                </div>
-            """, unsafe_allow_html=True)
+        # Off-hours the daily bars are final, so the live quote lookup is skipped
+        market_data = fetch_live_summary(tickers_to_fetch) if is_open else {}
+
+        # The closed market and any tickers fast_info missed read the daily bars
+        # from the heatmap's price panel (a superset), so this is usually a cache hit
+        missing = [ticker for ticker in tickers_to_fetch if ticker not in market_data]
+        metrics = dict.fromkeys(tickers_to_fetch, (0.0, 0.0))
+        if missing:
+            try:
+                metrics.update(daily_change(fetch_ticker_data(HEATMAP_TICKERS, period="1y"), missing))
+            except Exception:
+                pass
+        metrics.update(
+            (ticker, (data.get('lastPrice', 0.0), data.get('regularMarketChangePercent', 0.0)))
+            for ticker, data in market_data.items()
+        )
+
+        cards = [
+            get_metric_html("S&P 500 (SPY)", *metrics["SPY"], "--green-accent"),
+            get_metric_html("NASDAQ 100 (QQQ)", *metrics["QQQ"], "--red-neg"),
+            get_metric_html("VIX Index (^VIX)", *metrics["^VIX"], "--purple"),
+            _TIME_CARD_T.substitute(color=status_color, time=datetime.now(NY_TZ).strftime('%H:%M:%S EST')),
+        ]
+        # One element for the whole row; the .kpi-row grid replaces st.columns(4)
+        st.markdown(f'<div class="kpi-row">{"".join(cards)}</div>', unsafe_allow_html=True)
+
+
+@st.cache_data(ttl=PRICE_CACHE_TTL, max_entries=8, show_spinner=False)
+def heatmap_html(period, tickers_list):
+    """Builds the heatmap grid markup for a period; None when there is no data."""
+    flat, data_loaded = generate_heatmap_data(period, tickers_list)
+    if not data_loaded or flat.empty:
+        return None
+
+    # Box styles and signed return labels each come from one vectorized pass
+    rets = flat["ret"].to_numpy()
+    flat["style"] = compute_heatmap_styles(rets)
+    flat["ret_str"] = format_returns(rets)
+    boxes = "".join(map(HEATMAP_BOX_TMPL.format_map, flat.to_dict("records")))
+    return f'<div class="heatmap-grid-container">{boxes}</div>'
+
+def format_returns(rets):
+    """Signed two-decimal percent labels for an array of returns ('+' only when positive)."""
+    rets = np.asarray(rets, dtype='float64')
+    return np.char.add(np.where(rets > 0, "+", ""), np.char.mod("%.2f%%", rets))
+
+def movers_list_html(df, color):
+    """Builds the markup for one top movers list."""
+    ret_strs = format_returns(df["Return (%)"].to_numpy()).tolist()
+    price_strs = np.char.mod("%.2f", df["Price ($)"].to_numpy(dtype='float64')).tolist()
+    items = "".join(
+        MOVERS_ITEM_TMPL.format_map({"color": color, "ticker": ticker, "price": price, "ret": ret})
+        for ticker, ret, price in zip(df.index, ret_strs, price_strs)
+    )
+    return f'<div class="movers-list">{items}</div>'
+
+def store_movers(gainer_df, loser_df):
+    """Puts a scan result and its list markup into session state."""
+    st.session_state['gainer_df'] = gainer_df
+    st.session_state['loser_df'] = loser_df
+    # Markup is built once per scan and reused on every rerun until the next one
+    st.session_state['gainer_html'] = movers_list_html(gainer_df, "--green-accent") if not gainer_df.empty else ""
+    st.session_state['loser_html'] = movers_list_html(loser_df, "--red-neg") if not loser_df.empty else ""
+
+def save_movers_scan(gainer_df, loser_df, scan_time, period):
+    """Writes the latest scan to disk so new sessions start from it."""
+    try:
+        PRICE_CACHE_DIR.mkdir(exist_ok=True)
+        gainer_df.to_parquet(MOVERS_CACHE_FILES["gainers"])
+        loser_df.to_parquet(MOVERS_CACHE_FILES["losers"])
+        MOVERS_CACHE_FILES["meta"].write_text(json.dumps({"scan_time": scan_time.isoformat(), "period": period}))
+    except Exception:
+        pass
+
+def load_movers_scan():
+    """Reads the last saved scan as (gainer_df, loser_df, scan_time, period), or None."""
+    try:
+        meta = json.loads(MOVERS_CACHE_FILES["meta"].read_text())
+        return (
+            pd.read_parquet(MOVERS_CACHE_FILES["gainers"]),
+            pd.read_parquet(MOVERS_CACHE_FILES["losers"]),
+            datetime.fromisoformat(meta["scan_time"]),
+            meta.get("period"),
+        )
+    except Exception:
+        return None
+
+@st.cache_resource(show_spinner=False)
+def _scan_executor():
+    """Single worker shared by all sessions for background S&P 500 scans."""
+    return ThreadPoolExecutor(max_workers=1)
 
+def run_movers_scan(ticker_list, period, scan_time):
+    """Runs a scan on the worker and saves it, so the result outlives the session that started it."""
+    gainer_df, loser_df = get_top_movers_uncached(ticker_list, period, scan_time)
+    save_movers_scan(gainer_df, loser_df, scan_time, period)
+    return gainer_df, loser_df
 
 def render_heatmap_in_container(container, return_period):
     """Renders heatmap in the provided container."""
     with container:
-        heatmap_df, data_loaded = generate_heatmap_data(return_period, HEATMAP_TICKERS)
-        
-        if data_loaded and not heatmap_df.empty:
-            all_tickers_data = []
-            
-            major_data = heatmap_df.loc["Major Indices"].dropna()
-            for ticker, ret in major_data.items():
-                all_tickers_data.append({"ticker": ticker, "return": ret})
-            
-            sector_data = heatmap_df.loc["Sector ETFs"].dropna()
-            for ticker, ret in sector_data.items():
-                all_tickers_data.append({"ticker": ticker, "return": ret})
-
-            country_data = heatmap_df.loc["Country ETFs"].dropna()
-            for ticker, ret in country_data.items():
-                all_tickers_data.append({"ticker": ticker, "return": ret})
-            
-            # Build HTML as a list then join
-            html_parts = ['<div class="heatmap-grid-container">']
-            
-            for item in all_tickers_data:
-                ticker = item['ticker']
-                ret = item['return']
-                box_style = get_heatmap_color_style(ret)
-                return_str = f"{'+' if ret > 0 else ''}{ret:.2f}%"
-                
-                html_parts.append(f'<div class="heatmap-box" style="{box_style}">')
-                html_parts.append(f'<span class="heatmap-box-ticker">{ticker}</span>')
-                html_parts.append(f'<span class="heatmap-box-return">{return_str}</span>')
-                html_parts.append('</div>')
-            
-            html_parts.append('</div>')
-            html_content = ''.join(html_parts)
-            
+        # Reruns with the same period reuse this session's markup without touching the cache
+        if (
+            st.session_state.get('last_period') != return_period
+            or 'heatmap_html' not in st.session_state
+            or time.time() - st.session_state['heatmap_html_at'] >= PRICE_CACHE_TTL
+        ):
+            st.session_state['heatmap_html'] = heatmap_html(return_period, HEATMAP_TICKERS)
+            st.session_state['heatmap_html_at'] = time.time()
+            st.session_state['last_period'] = return_period
+        html_content = st.session_state['heatmap_html']
+        if html_content:
             st.markdown(html_content, unsafe_allow_html=True)
         else:
             st.warning("Could not load market data for the heatmap.")
@@ -425,244 +622,36 @@ def render_heatmap_in_container(container, return_period):
 # --------------------------------------------------------------------------------------
 # CSS injection
 # --------------------------------------------------------------------------------------
-st.markdown(
-    dedent(
-        f"""
-        <style>
-        :root {{
-          --bg:{BLOOM_BG}; --panel:{BLOOM_PANEL}; --text:{BLOOM_TEXT}; --muted:{BLOOM_MUTED};
-          --muted-text-new: rgba(255, 255, 255, 0.75);
-          --neutral:{NEUTRAL_GRAY}; --input:{INPUT_BG}; --inputlight:{INPUT_BG_LIGHT};
-          --blue:{ACCENT_BLUE}; --green:{ACCENT_GREEN}; --purple:{ACCENT_PURPLE};
-          --green-accent: #26D07C;
-          --red-neg: #D9534F; 
-          --sidebar-bg: {BLOOM_PANEL};
-          --card-purple-shadow: rgba(138, 124, 245, 0.4); 
-        }}
-        html, body {{
-          height:100%;
-          background: radial-gradient(1200px 600px at 15% -10%, rgba(43,179,243,0.15), transparent 60%),
-                      radial-gradient(1200px 600px at 85% 110%, rgba(138,124,245,0.15), transparent 60%),
-                      linear-gradient(135deg, var(--bg) 0%, {DARK_PURPLE} 100%) fixed !important;
-        }}
-        .stApp {{ background:transparent!important; color:var(--text); }}
-        .block-container {{ max-width: 1500px; padding-top: .6rem; padding-bottom: 2rem; }}
-        header[data-testid="stHeader"] {{ background:transparent!important; height:2.5rem!important; }}
-        [data-testid="stDecoration"] {{ background:transparent!important; }}
-
-        div[data-testid="stHeader"] > div:last-child > div:last-child {{
-            color: var(--muted-text-new) !important;
-        }}
-        div[data-testid="stAppViewContainer"] > div > div > div > div:nth-child(2) > div {{
-            color: var(--muted-text-new) !important;
-        }}
-        .kpi .h {{ 
-            color: var(--muted-text-new) !important; 
-        }}
-        .text-gray-400 {{
-            color: var(--muted-text-new) !important;
-        }}
-        
-        div[data-testid="stAppViewContainer"] label {{
-            color: var(--text) !important;
-            font-weight: 600;
-        }}
-
-        .stMarkdown, .stText, h1, h2, h3, h4, h5, h6 {{
-            color: var(--text) !important;
-        }}
-
-        section[data-testid="stSidebar"], aside[data-testid="stSidebar"] {{
-          background: var(--sidebar-bg) !important;
-          box-shadow: 4px 0 10px rgba(0,0,0,0.4);
-        }}
-        
-        [data-testid="stSidebar"] .stMarkdown > div {{
-            color: var(--muted) !important; 
-        }}
-        
-        [data-testid="stSidebarNav"] a, [data-testid="stSidebarNav"] svg {{
-            color: var(--text) !important;
-            fill: var(--text) !important;
-            transition: all 0.2s;
-        }}
-        [data-testid="stSidebarNav"] a:hover {{
-            color: var(--green-accent) !important;
-        }}
-        
-        /* Make sidebar navigation links text white */
-        [data-testid="stSidebarNav"] li a span {{
-            color: var(--text) !important;
-        }}
-        [data-testid="stSidebarNav"] li a:hover span {{
-            color: var(--green-accent) !important;
-        }}
-        [data-testid="stSidebarNav"] ul li {{
-            color: var(--text) !important;
-        }}
-        
-        .strategy-link-card {{
-            background: linear-gradient(180deg, rgba(255,255,255,0.08), rgba(255,255,255,0.00));
-            border: 1px solid var(--neutral); 
-            border-radius: 16px;
-            padding: 24px;
-            box-shadow: 0 5px 15px rgba(0,0,0,.4); 
-            transition: all 0.3s cubic-bezier(0.25, 0.46, 0.45, 0.94); 
-            height: 100%;
-            display: flex; 
-            flex-direction: column;
-            justify-content: space-between;
-        }}
-        .strategy-link-card:hover {{
-            border-color: var(--purple); 
-            transform: translateY(-5px); 
-            box-shadow: 0 15px 40px var(--card-purple-shadow); 
-        }}
-
-        .strategy-link-desc {{ color: var(--muted-text-new); font-size: 1.0rem; }} 
-
-        .strategy-link-title {{ 
-            font-weight: 800; 
-            font-size: 1.5rem; 
-            letter-spacing: .5px; 
-            display: flex;
-            align-items: center;
-            gap: 15px; 
-            margin-bottom: 10px;
-        }}
-
-        .heatmap-grid-container {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 12px;
-            padding: 15px;
-            background: var(--inputlight);
-            border-radius: 12px;
-            box-shadow: inset 0 0 10px rgba(0,0,0,0.2);
-        }}
-        .heatmap-box {{
-            flex-grow: 1; 
-            flex-basis: 120px;
-            min-height: 80px;
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-            align-items: center;
-            border-radius: 8px;
-            padding: 8px;
-            font-weight: 700;
-            transition: all 0.3s;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.3);
-            cursor: default;
-        }}
-        .heatmap-box-ticker {{
-            font-size: 1.1rem;
-            font-weight: 900;
-            line-height: 1.2;
-            margin-bottom: 2px;
-            color: var(--text);
-        }}
-        .heatmap-box-return {{
-            font-size: 0.85rem;
-            line-height: 1.0;
-            opacity: 0.8;
-            color: var(--text);
-        }}
-        .heatmap-box:hover {{
-            transform: scale(1.03);
-            opacity: 0.95;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.5);
-        }}
-        
-        .movers-list {{
-            background: var(--inputlight);
-            border: 1px solid var(--neutral);
-            border-radius: 12px;
-            padding: 15px;
-            height: 100%;
-        }}
-        .movers-item {{
-            display: flex;
-            justify-content: space-between;
-            padding: 8px 0;
-            border-bottom: 1px dashed rgba(255, 255, 255, 0.1);
-            font-size: 1.05rem;
-        }}
-        .movers-item:last-child {{
-            border-bottom: none;
-        }}
-        .movers-ticker {{
-            font-weight: 800;
-            flex: 0 0 25%;
-        }}
-        .movers-price {{
-            font-weight: 500;
-            flex: 0 0 35%;
-            text-align: right;
-            padding-right: 15px;
-            color: var(--muted-text-new);
-        }}
-        .movers-return {{
-            font-weight: 700;
-            flex: 0 0 40%;
-            text-align: right;
-        }}
-        
-        /* Style the navigation buttons */
-        .stButton > button {{
-            background: var(--input) !important;
-            color: var(--text) !important;
-            border: 1px solid var(--neutral) !important;
-            border-radius: 8px !important;
-            font-weight: 600 !important;
-            padding: 10px 16px !important;
-            transition: all 0.2s !important;
-            width: 100% !important;
-        }}
-        .stButton > button:hover {{
-            background: var(--inputlight) !important;
-            border-color: var(--purple) !important;
-            color: var(--purple) !important;
-        }}
-        .stButton > button p {{
-            color: var(--text) !important;
-            margin: 0 !important;
-        }}
-        .stButton > button:hover p {{
-            color: var(--purple) !important;
-        }}
-        </style>
-        """
-    ),
-    unsafe_allow_html=True
-)
+@st.cache_resource(show_spinner=False)
+def _css():
+    """Reads the global stylesheet once per process."""
+    return f"<style>{STYLES_PATH.read_text()}</style>"
+
+st.markdown(_css(), unsafe_allow_html=True)
 
 # --------------------------------------------------------------------------------------
 # Header
 # --------------------------------------------------------------------------------------
-st.markdown(
-    """
-    <div style="display:flex;align-items:center;gap:12px;padding:12px 20px;margin:0 0 10px 0;border-bottom:1px solid var(--neutral);">
-      <svg width="28" height="28" viewBox="0 0 24 24" fill="none">
-        <rect x="2" y="3" width="20" height="18" rx="3" stroke="#2BB3F3" stroke-width="1.5"/>
-        <polyline points="5,15 9,11 12,13 17,7 19,9" stroke="#26D07C" stroke-width="2" fill="none" />
-        <circle cx="19" cy="9" r="1.8" fill="#26D07C"/>
-      </svg>
-      <div style="font-weight:900;letter-spacing:.3px;font-size:1.6rem;">D-HAM</div>
-      <div style="margin-left:auto;font-size:.95rem;color:rgba(255,255,255,.70);font-weight:500;">Multi‑Strategy Workspace</div>
-    </div>
-    """,
-    unsafe_allow_html=True
-)
-
-st.markdown(
-    """
-    <div style="text-align:center; font-size:1.05rem; font-style:italic; color:rgba(255,255,255,0.80); margin:-4px 0 18px 0;">
-      "You're either a smart-fella or fart smella" – Confucius
-    </div>
-    """,
-    unsafe_allow_html=True
-)
+# Static banner and tagline, sent as one element
+HEADER_HTML = """
+<div style="display:flex;align-items:center;gap:12px;padding:12px 20px;margin:0 0 10px 0;border-bottom:1px solid var(--neutral);">
+  <svg width="28" height="28" viewBox="0 0 24 24" fill="none">
+    <rect x="2" y="3" width="20" height="18" rx="3" stroke="#2BB3F3" stroke-width="1.5"/>
+    <polyline points="5,15 9,11 12,13 17,7 19,9" stroke="#26D07C" stroke-width="2" fill="none" />
+    <circle cx="19" cy="9" r="1.8" fill="#26D07C"/>
+  </svg>
+  <div style="font-weight:900;letter-spacing:.3px;font-size:1.6rem;">D-HAM</div>
+  <div style="margin-left:auto;font-size:.95rem;color:rgba(255,255,255,.70);font-weight:500;">Multi‑Strategy Workspace</div>
+</div>
+<div style="text-align:center; font-size:1.05rem; font-style:italic; color:rgba(255,255,255,0.80); margin:-4px 0 18px 0;">
+  "You're either a smart-fella or fart smella" – Confucius
+</div>
+"""
+
+st.markdown(HEADER_HTML, unsafe_allow_html=True)
+
+# The first visitor's price download overlaps the sidebar and navigation render
+_warm_price_cache()
 
 # Initialize Session State
 if "tickers" not in st.session_state:
@@ -672,6 +661,12 @@ if "ma_window" not in st.session_state:
 if "lookback" not in st.session_state:
     st.session_state["lookback"] = 200
 
+# Market status is computed once per rerun and shared by the sidebar and summary
+now, is_open, status_text, status_color, cache_ttl = get_market_status()
+# Stamped on the session's first run only, from the clock rather than the shared 30s status cache
+if "session_start" not in st.session_state:
+    st.session_state["session_start"] = datetime.now(NY_TZ).strftime('%Y-%m-%d %H:%M:%S')
+
 # --------------------------------------------------------------------------------------
 # Sidebar
 # --------------------------------------------------------------------------------------
@@ -679,8 +674,8 @@ with st.sidebar:
     st.markdown("### Workspace Info")
     st.markdown(f"""
         <div style="color: var(--muted); font-size: .85rem; padding: 10px 0;">
-            <p>Session started <b>{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</b></p>
-            <p>Cache TTL: <b>{get_market_status()[4].total_seconds() / 3600:.1f} hours</b></p>
+            <p>Session started <b>{st.session_state["session_start"]}</b></p>
+            <p>Cache TTL: <b>{cache_ttl.total_seconds() / 3600:.1f} hours</b></p>
         </div>
     """, unsafe_allow_html=True)
     st.markdown("---")
@@ -704,8 +699,6 @@ with st.sidebar:
 st.markdown("### Today's Market Summary")
 st.caption("Live data summary based on US market hours (EST/EDT).")
 
-now, is_open, status_text, status_color, _ = get_market_status()
-
 st.markdown(f"""
     <div style="margin-bottom: 5px; margin-top: -10px;">
         <h4 style="font-size: 1.15rem; font-weight: 700; margin: 0; padding: 0;">
@@ -735,8 +728,8 @@ if is_open:
         st.session_state.market_last_update = current_time
         # Clear only the live data cache
         fetch_live_summary.clear()
-        # Re-render the container with fresh data
-        render_market_kpis_in_container(market_kpi_container, is_open, status_text, status_color)
+        # The rerun renders the container with fresh data; rendering here first
+        # would fetch the same quotes twice
         st.rerun()
 
 st.markdown("---")
@@ -753,23 +746,33 @@ PAGE_MAPPING = {
     "Seasonality": {"file": "5_Seasonality.py", "desc": "Seasonal Patterns & Calendar Effects"},
 }
 pages_dir = Path("pages")
-available = []
+
+@st.cache_resource(ttl="60s", show_spinner=False)
+def _available_pages():
+    """(label, file, desc) for each mapped page present in pages/, from one directory read."""
+    if not pages_dir.is_dir():
+        return ()
+    with os.scandir(pages_dir) as entries:
+        page_files = frozenset(e.name for e in entries)
+    return tuple(
+        (label, data["file"], data["desc"])
+        for label, data in PAGE_MAPPING.items()
+        if data["file"] in page_files
+    )
+
+# Flush single-line markup; the nav loop only fills in label and description
+CARD_TMPL = (
+    '<div class="strategy-link-card"><div>'
+    '<div class="strategy-link-title">{label}</div>'
+    '<div class="strategy-link-desc">{desc}</div>'
+    '</div></div>'
+)
 
 def get_card_html(label, desc):
     """Generates the clean card HTML structure."""
-    return dedent(f"""
-        <div class="strategy-link-card">
-            <div>
-                <div class="strategy-link-title">{label}</div>
-                <div class="strategy-link-desc">{desc}</div>
-            </div>
-        </div>
-    """)
+    return CARD_TMPL.format(label=label, desc=desc)
 
-for label, data in PAGE_MAPPING.items():
-    rel_path = pages_dir / data["file"]
-    if rel_path.exists():
-        available.append((label, data["file"], data["desc"]))
+available = _available_pages()
 
 if available:
     # Display navigation cards in rows of 3
@@ -793,72 +796,90 @@ st.markdown("---")
 # --------------------------------------------------------------------------------------
 st.markdown("### Market Return Heatmap")
 
-# Create columns for the selector and update button
-col_period, col_update, col_status = st.columns([2, 1, 2])
-
-with col_period:
-    return_period = st.selectbox(
-        "Select Return Period", 
-        options=['1D', '7D', '30D', 'YTD', '1Y'], 
-        index=0, 
-        key='return_period_toggle'
-    )
-
-# Initialize session state for heatmap updates
-if 'heatmap_last_update' not in st.session_state:
-    st.session_state.heatmap_last_update = datetime.now()
-    st.session_state.heatmap_update_count = 0
-
-with col_update:
-    st.markdown("<div style='height: 4px;'></div>", unsafe_allow_html=True)  # Spacer for alignment
-    update_clicked = st.button("Update Heatmap", type="primary", use_container_width=True,
-                                help="Fetch the latest return data")
-
-with col_status:
-    time_since_update = datetime.now() - st.session_state.heatmap_last_update
-    minutes_ago = int(time_since_update.total_seconds() / 60)
-    if minutes_ago < 1:
-        time_str = "just now"
-    elif minutes_ago == 1:
-        time_str = "1 minute ago"
-    elif minutes_ago < 60:
-        time_str = f"{minutes_ago} minutes ago"
-    else:
-        hours_ago = minutes_ago // 60
-        time_str = f"{hours_ago} hour{'s' if hours_ago > 1 else ''} ago"
+@st.fragment
+def heatmap_section():
+    """Period selector, refresh controls and grid; reruns on its own when they change."""
+    # Create columns for the selector and update button
+    col_period, col_update, col_status = st.columns([2, 1, 2])
+
+    with col_period:
+        return_period = st.selectbox(
+            "Select Return Period", 
+            options=HEATMAP_PERIODS,
+            index=0, 
+            key='return_period_toggle'
+        )
+
+    # Initialize session state for heatmap updates
+    if 'heatmap_last_update' not in st.session_state:
+        st.session_state.heatmap_last_update = datetime.now()
+        st.session_state.heatmap_update_count = 0
+
+    with col_update:
+        st.markdown("<div style='height: 4px;'></div>", unsafe_allow_html=True)  # Spacer for alignment
+        update_clicked = st.button("Update Heatmap", type="primary", use_container_width=True,
+                                    help="Fetch the latest return data")
+
+    with col_status:
+        time_since_update = datetime.now() - st.session_state.heatmap_last_update
+        minutes_ago = int(time_since_update.total_seconds() / 60)
+        if minutes_ago < 1:
+            time_str = "just now"
+        elif minutes_ago == 1:
+            time_str = "1 minute ago"
+        elif minutes_ago < 60:
+            time_str = f"{minutes_ago} minutes ago"
+        else:
+            hours_ago = minutes_ago // 60
+            time_str = f"{hours_ago} hour{'s' if hours_ago > 1 else ''} ago"
     
-    st.markdown(f"""
-        <div style="font-size: .85rem; color: var(--muted-text-new); margin-top: 10px;">
-            Last Updated: {time_str}
-        </div>
-    """, unsafe_allow_html=True)
-
-# Handle update button click
-if update_clicked:
-    st.session_state.heatmap_last_update = datetime.now()
-    # Clear heatmap-related caches
-    fetch_ticker_data.clear()
-    generate_heatmap_data.clear()
-    st.success("Heatmap data refreshed!")
-    st.rerun()
-
-# Create empty container for heatmap
-heatmap_container = st.empty()
-
-# Initial render
-render_heatmap_in_container(heatmap_container, return_period)
+        st.markdown(f"""
+            <div style="font-size: .85rem; color: var(--muted-text-new); margin-top: 10px;">
+                Last Updated: {time_str}
+            </div>
+        """, unsafe_allow_html=True)
+
+    # Handle update button click
+    if update_clicked:
+        st.session_state.heatmap_last_update = datetime.now()
+        # Clear heatmap-related caches
+        clear_price_cache()
+        get_heatmap_returns.clear()
+        generate_heatmap_data.clear()
+        heatmap_html.clear()
+        st.session_state.pop('heatmap_html', None)
+        st.success("Heatmap data refreshed!")
+        st.rerun(scope="fragment")
+
+    # Create empty container for heatmap
+    heatmap_container = st.empty()
+
+    # Initial render
+    render_heatmap_in_container(heatmap_container, return_period)
+
+heatmap_section()
+# Read back from the widget so the movers scan uses the same period
+return_period = st.session_state['return_period_toggle']
 
 st.markdown("---")
 
 # --------------------------------------------------------------------------------------
 # 📈 Top Movers Section (Manually Triggered)
 # --------------------------------------------------------------------------------------
-st.markdown(f"### Top Movers (S&P 500 Scan)")
+st.markdown("### Top Movers (S&P 500 Scan)")
 
 if 'movers_run' not in st.session_state:
     st.session_state['movers_run'] = datetime.min
+    st.session_state['movers_period'] = None
     st.session_state['gainer_df'] = pd.DataFrame()
     st.session_state['loser_df'] = pd.DataFrame()
+    st.session_state['gainer_html'] = ""
+    st.session_state['loser_html'] = ""
+    # A new session picks up the most recent scan from disk instead of starting empty
+    saved_scan = load_movers_scan()
+    if saved_scan is not None:
+        gainer_df, loser_df, st.session_state['movers_run'], st.session_state['movers_period'] = saved_scan
+        store_movers(gainer_df, loser_df)
 
 col_btn, col_status = st.columns([1, 1.5])
 
@@ -867,84 +888,58 @@ with col_btn:
                             help="Fetch and analyze the latest data for all S&P 500 tickers.")
 
 with col_status:
+    # The lists keep the period they were scanned with, which may differ from the selectbox
+    movers_period = st.session_state.get('movers_period')
+    scan_period = f" ({movers_period} returns)" if movers_period else ""
     st.markdown(f"""
         <div style="font-size: .85rem; color: var(--muted-text-new); margin-top: 10px; text-align: right;">
-            Last Scan Time: {st.session_state['movers_run'].strftime('%Y-%m-%d %H:%M:%S')}
+            Last Scan Time: {st.session_state['movers_run'].strftime('%Y-%m-%d %H:%M:%S')}{scan_period}
         </div>
     """, unsafe_allow_html=True)
 
-if run_clicked:
-    fetch_ticker_data.clear()
-    get_top_movers_uncached.clear() 
+if run_clicked and 'scan_future' not in st.session_state:
+    # The scan does its own download; leave the heatmap/KPI price cache warm
+    get_top_movers_uncached.clear()
     st.session_state['movers_run'] = datetime.now()
-    
-    # Create a progress bar
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
-    status_text.text(f"Downloading data for {len(SPX_MOVER_TICKERS)} tickers...")
-    progress_bar.progress(25)
-    
-    gainer_df, loser_df = get_top_movers_uncached(SPX_MOVER_TICKERS, return_period, st.session_state['movers_run'])
-    
-    progress_bar.progress(75)
-    status_text.text("Processing results...")
-    
-    st.session_state['gainer_df'] = gainer_df
-    st.session_state['loser_df'] = loser_df
-    
-    progress_bar.progress(100)
-    status_text.text("Scan complete!")
-    
-    # Clean up progress indicators
-    time.sleep(0.5)
-    progress_bar.empty()
-    status_text.empty()
-    
-    st.success("S&P 500 scan complete!")
-    st.rerun()
-    
-gainer_df = st.session_state['gainer_df']
-loser_df = st.session_state['loser_df']
+    st.session_state['movers_period'] = return_period
+    # Runs on a worker thread so this session keeps responding while ~500 tickers download
+    st.session_state['scan_future'] = _scan_executor().submit(
+        run_movers_scan, SPX_MOVER_TICKERS, return_period, st.session_state['movers_run']
+    )
+
+if 'scan_future' in st.session_state:
+    scan_future = st.session_state['scan_future']
+    if scan_future.done():
+        del st.session_state['scan_future']
+        try:
+            gainer_df, loser_df = scan_future.result()
+        except Exception as e:
+            st.error(f"S&P 500 scan failed: {e}")
+        else:
+            store_movers(gainer_df, loser_df)
+            st.success("S&P 500 scan complete!")
+    else:
+        with st.status(f"Scanning {len(SPX_MOVER_TICKERS)} S&P 500 tickers...", state="running"):
+            st.write("Downloading price history; results will appear here when the scan finishes.")
+        time.sleep(1)
+        st.rerun()
+
+gainer_html = st.session_state.get('gainer_html', "")
+loser_html = st.session_state.get('loser_html', "")
 
 col_gainers, col_losers = st.columns(2)
 
 with col_gainers:
-    st.markdown("#### Top 5 Gainers", unsafe_allow_html=True)
-    if not gainer_df.empty:
-        gainer_list_html = '<div class="movers-list">'
-        for ticker, row in gainer_df.iterrows():
-            return_str = f"+{row['Return (%)']:.2f}%"
-            price_str = f"{row['Price ($)']:.2f}"
-            
-            gainer_list_html += dedent(f"""
-                <div class="movers-item">
-                    <span class="movers-ticker" style="color: var(--green-accent);">{ticker}</span>
-                    <span class="movers-price">${price_str}</span>
-                    <span class="movers-return" style="color: var(--green-accent);">{return_str}</span>
-                </div>
-            """)
-        gainer_list_html += '</div>'
-        st.markdown(gainer_list_html, unsafe_allow_html=True)
+    if gainer_html:
+        # Heading and list go out as one element
+        st.markdown(f"#### Top 5 Gainers\n\n{gainer_html}", unsafe_allow_html=True)
     else:
+        st.markdown("#### Top 5 Gainers")
         st.info("Click 'Run S&P 500 Scan' to fetch data.")
 
 with col_losers:
-    st.markdown("#### Top 5 Losers", unsafe_allow_html=True)
-    if not loser_df.empty:
-        loser_list_html = '<div class="movers-list">'
-        for ticker, row in loser_df.iterrows():
-            return_str = f"{row['Return (%)']:.2f}%"
-            price_str = f"{row['Price ($)']:.2f}"
-            
-            loser_list_html += dedent(f"""
-                <div class="movers-item">
-                    <span class="movers-ticker" style="color: var(--red-neg);">{ticker}</span>
-                    <span class="movers-price">${price_str}</span>
-                    <span class="movers-return" style="color: var(--red-neg);">{return_str}</span>
-                </div>
-            """)
-        loser_list_html += '</div>'
-        st.markdown(loser_list_html, unsafe_allow_html=True)
+    if loser_html:
+        st.markdown(f"#### Top 5 Losers\n\n{loser_html}", unsafe_allow_html=True)
     else:
+        st.markdown("#### Top 5 Losers")
         st.info("Click 'Run S&P 500 Scan' to fetch data.")
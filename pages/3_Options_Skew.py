@@ -1,4 +1,5 @@
 # pages/3_Options_Skew.py
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
 import yfinance as yf
 import pandas as pd
@@ -18,12 +19,20 @@ ACCENT_PURPLE  = "#8A7CF5"
 
 # --- Helper to Get Skew Data ---
 # Note: Since the core options fetching function is heavy, we'll redefine it
-# here, slightly adapting the logic for plotting, but keeping it uncached 
-# to run in the strategy page scope.
+# here, slightly adapting the logic for plotting, and cache it per ticker.
 
-def get_options_chain_for_plot(ticker_symbol='SPY'):
+def _prep_side(df, current_price):
+    """Keeps strikes within 0.90-1.10 moneyness with a usable IV, sorted by moneyness."""
+    iv = pd.to_numeric(df['impliedVolatility'], errors='coerce').to_numpy(dtype=float) * 100 # Convert to %
+    m = df['strike'].to_numpy(dtype=float) / current_price
+    mask = (m >= 0.90) & (m <= 1.10) & (iv > 0.1)
+    return df.iloc[mask].assign(moneyness=m[mask], impliedVolatility=iv[mask]).sort_values('moneyness', kind='stable')
+
+@st.cache_data(ttl=300, show_spinner=False)  # chain + price are network-bound; reuse for 5 minutes
+def _fetch_skew_chain(ticker_symbol):
     """
-    Fetches the option chain for the expiration date closest to 30 days out.
+    Fetches the filtered calls/puts for the expiration closest to 30 days out.
+    Failures raise instead of returning, so Streamlit never caches them.
     """
     ticker = yf.Ticker(ticker_symbol)
     
@@ -32,47 +41,39 @@ def get_options_chain_for_plot(ticker_symbol='SPY'):
     target_date = today + timedelta(days=30)
     
     if not ticker.options:
-        return None, None, 0, "No active options chain found."
+        raise ValueError("No active options chain found.")
         
     available_dates = [datetime.strptime(d, '%Y-%m-%d').date() for d in ticker.options]
     closest_date = min(available_dates, key=lambda d: abs(d - target_date))
     closest_date_str = closest_date.strftime('%Y-%m-%d')
     dte = (closest_date - today).days
 
-    # 2. Fetch the option chain and current price
-    try:
-        chain = ticker.option_chain(closest_date_str)
-        current_price = ticker.info.get('regularMarketPrice', None)
-    except Exception as e:
-        return None, None, 0, f"Failed to fetch options chain or price: {e}"
+    # 2. Fetch the option chain and current price (independent requests, so issue them together)
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        chain_future = ex.submit(ticker.option_chain, closest_date_str)
+        price_future = ex.submit(lambda: ticker.info.get('regularMarketPrice', None))
+        chain = chain_future.result()
+        current_price = price_future.result()
 
     if current_price is None:
-        return None, None, 0, "Failed to fetch current market price."
+        raise ValueError("Failed to fetch current market price.")
 
-    # 3. Clean and prepare dataframes
-    calls = chain.calls.copy()
-    puts = chain.puts.copy()
-    
-    calls['impliedVolatility'] = pd.to_numeric(calls['impliedVolatility'], errors='coerce') * 100 # Convert to %
-    puts['impliedVolatility'] = pd.to_numeric(puts['impliedVolatility'], errors='coerce') * 100   # Convert to %
-    
-    # Calculate Moneyness (Strike / Current Price)
-    calls['moneyness'] = calls['strike'] / current_price
-    puts['moneyness'] = puts['strike'] / current_price
-    
-    # Filter to the desired moneyness range: -10% to +10% (0.90 to 1.10)
-    calls_filtered = calls[
-        (calls['moneyness'] >= 0.90) & 
-        (calls['moneyness'] <= 1.10) & 
-        (calls['impliedVolatility'] > 0.1)
-    ].sort_values('moneyness')
-    
-    puts_filtered = puts[
-        (puts['moneyness'] >= 0.90) & 
-        (puts['moneyness'] <= 1.10) & 
-        (puts['impliedVolatility'] > 0.1)
-    ].sort_values('moneyness')
+    # 3. Filter to the -10%/+10% moneyness band, then derive columns on the survivors only
+    calls_filtered = _prep_side(chain.calls, current_price)
+    puts_filtered = _prep_side(chain.puts, current_price)
     
+    return calls_filtered, puts_filtered, dte
+
+def get_options_chain_for_plot(ticker_symbol='SPY'):
+    """
+    Returns (calls, puts, dte, error); errors come back as a message and are retried on the next run.
+    """
+    try:
+        calls_filtered, puts_filtered, dte = _fetch_skew_chain(ticker_symbol)
+    except ValueError as e:
+        return None, None, 0, str(e)
+    except Exception as e:
+        return None, None, 0, f"Failed to fetch options chain or price: {e}"
     return calls_filtered, puts_filtered, dte, None
 
 # --- Plotting Function using Plotly ---
@@ -127,8 +128,13 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Apply basic styling for consistency
-st.markdown(dedent(f"""
+# ---------------------------------------------------------------------
+# Styling + Header
+# ---------------------------------------------------------------------
+@st.cache_resource(show_spinner=False)
+def _page_chrome():
+    """Stylesheet and header markup; built once per process since they only use theme constants."""
+    css = dedent(f"""
 <style>
 /* Inherit the main gradient background */
 html, body {{
@@ -148,13 +154,8 @@ div[data-testid="stAppViewContainer"] [data-baseweb="select"] > div {{
 /* Sidebar metric text consistency */
 div[data-testid="stMetric"] * {{ color: {BLOOM_TEXT} !important; }}
 </style>
-"""), unsafe_allow_html=True)
-
-# ---------------------------------------------------------------------
-# Header
-# ---------------------------------------------------------------------
-st.markdown(
-    f"""
+""")
+    header = dedent(f"""
     <div style="display:flex;align-items:center;gap:12px;padding:12px 20px;margin:0 0 8px 0;border-bottom:1px solid {NEUTRAL_GRAY};">
       <svg width="28" height="28" viewBox="0 0 24 24" fill="none">
         <rect x="2" y="3" width="20" height="18" rx="3" stroke="{ACCENT_PURPLE}" stroke-width="1.5"/>
@@ -164,9 +165,11 @@ st.markdown(
       <div style="font-weight:900;letter-spacing:.3px;font-size:1.6rem;">Options Skew Analysis</div>
       <div style="margin-left:auto;font-size:.95rem;color:rgba(255,255,255,.70);font-weight:500;">Implied Volatility Difference</div>
     </div>
-    """,
-    unsafe_allow_html=True
-)
+    """)
+    return css + header
+
+# Apply basic styling for consistency, plus the page header, as one element
+st.markdown(_page_chrome(), unsafe_allow_html=True)
 
 st.info("This tool visualizes the current Volatility Skew (Smile) for a near-term expiration date.")
 